@@ -51,6 +51,13 @@ from backend.logs.agent_logging import (
 MAX_AGENT_STEPS = 20
 MAX_TOKENS = 4096
 
+# The tool list is identical for every run and every step, so build and
+# serialize it once instead of re-dumping it for each payload-size log.
+_TOOLS = [build_explore_tool_schema()]
+_TOOLS_JSON = json.dumps(_TOOLS, ensure_ascii=True, default=str)
+
+_ANTHROPIC_CLIENTS: dict[str, anthropic.Anthropic] = {}
+
 
 @dataclass
 class AgentResult:
@@ -126,25 +133,37 @@ def _estimate_tokens(text: str) -> int:
     return max(1, len(text) // 4)
 
 
-def _payload_metrics(system_prompt: str, messages: list, tools: list) -> dict:
+def _payload_metrics(system_prompt: str, messages: list) -> dict:
     system_len = len(system_prompt or "")
     messages_json = json.dumps(messages, ensure_ascii=True, default=str)
-    tools_json = json.dumps(tools, ensure_ascii=True, default=str)
-    total_len = system_len + len(messages_json) + len(tools_json)
+    total_len = system_len + len(messages_json) + len(_TOOLS_JSON)
     approx_tokens = (
         _estimate_tokens(system_prompt)
         + _estimate_tokens(messages_json)
-        + _estimate_tokens(tools_json)
+        + _estimate_tokens(_TOOLS_JSON)
     )
     return {
         "system_chars": system_len,
         "messages_chars": len(messages_json),
-        "tools_chars": len(tools_json),
+        "tools_chars": len(_TOOLS_JSON),
         "total_chars": total_len,
         "approx_context_tokens": approx_tokens,
     }
 
 
+def _get_anthropic_client(api_key: str) -> anthropic.Anthropic:
+    """Return a cached Anthropic client so runs share one HTTP connection pool.
+
+    Keyed on the API key so rotating ``ANTHROPIC_API_KEY`` at runtime yields a
+    fresh client instead of silently reusing the old one.
+    """
+    client = _ANTHROPIC_CLIENTS.get(api_key)
+    if client is None:
+        client = anthropic.Anthropic(api_key=api_key)
+        _ANTHROPIC_CLIENTS[api_key] = client
+    return client
+
+
 def _extract_text_blocks(message) -> str:
     parts = []
     for block in getattr(message, "content", []):
@@ -267,8 +286,8 @@ def run_agent(
             )
 
         model = get_anthropic_model()
-        tools = [build_explore_tool_schema()]
-        client = anthropic.Anthropic(api_key=api_key)
+        tools = _TOOLS
+        client = _get_anthropic_client(api_key)
         messages: list[dict[str, Any]] = [
             {"role": "user", "content": user_message}
         ]
@@ -287,7 +306,7 @@ def run_agent(
         usage_totals: dict[str, int] = {}
         api_calls = 0
 
-        initial_metrics = _payload_metrics(system_prompt, messages, tools)
+        initial_metrics = _payload_metrics(system_prompt, messages)
         log_agent_event(
             f"{agent_label}_payload_size",
             request_id=rid,
@@ -397,7 +416,7 @@ def run_agent(
                 )
 
             messages.append({"role": "user", "content": tool_results})
-            post_metrics = _payload_metrics(system_prompt, messages, tools)
+            post_metrics = _payload_metrics(system_prompt, messages)
             log_agent_event(
                 f"{agent_label}_payload_size",
                 request_id=rid,
@@ -12,7 +12,8 @@ dispatches on ``action``:
 
 from __future__ import annotations
 
-from typing import Any
+from dataclasses import dataclass
+from typing import Any, Callable
 
 from backend.bigquery import status as bq_status
 from backend.bigquery.runner import run_bq_query
@@ -171,6 +172,46 @@ def _bq_describe(
     return out
 
 
+@dataclass(frozen=True)
+class _ExploreOptions:
+    """Per-agent settings fixed by the caller, not chosen by the model."""
+
+    include_web_summary: bool = False
+    include_game_summary: bool = False
+    game_filtered_scan: dict[str, Any] | None = None
+
+
+def _handle_describe(
+    tool_input: dict, property_id: str, opts: _ExploreOptions
+) -> dict[str, Any]:
+    return _bq_describe(
+        property_id,
+        include_web_summary=opts.include_web_summary,
+        include_game_summary=opts.include_game_summary,
+        game_filtered_scan=opts.game_filtered_scan,
+    )
+
+
+def _handle_query(
+    tool_input: dict, property_id: str, opts: _ExploreOptions
+) -> dict[str, Any]:
+    query = tool_input.get("query")
+    if not query:
+        return {"error": "query is required when action='query'."}
+    return run_bq_query(query, property_id)
+
+
+# ``action`` -> handler. Every handler takes ``(tool_input, property_id,
+# opts)``; new actions register here instead of growing an if-chain in
+# :func:`explore_bigquery`.
+_ACTIONS: dict[
+    str, Callable[[dict, str, _ExploreOptions], dict[str, Any]]
+] = {
+    "describe": _handle_describe,
+    "query": _handle_query,
+}
+
+
 def explore_bigquery(
     tool_input: dict,
     property_id: str,
@@ -188,16 +229,12 @@ def explore_bigquery(
     if not isinstance(tool_input, dict):
         return {"error": "Invalid tool input."}
     action = tool_input.get("action")
-    if action == "describe":
-        return _bq_describe(
-            property_id,
-            include_web_summary=include_web_summary,
-            include_game_summary=include_game_summary,
-            game_filtered_scan=game_filtered_scan,
-        )
-    if action == "query":
-        query = tool_input.get("query")
-        if not query:
-            return {"error": "query is required when action='query'."}
-        return run_bq_query(query, property_id)
-    return {"error": f"Unsupported action: {action}."}
+    handler = _ACTIONS.get(action) if isinstance(action, str) else None
+    if handler is None:
+        return {"error": f"Unsupported action: {action}."}
+    opts = _ExploreOptions(
+        include_web_summary=include_web_summary,
+        include_game_summary=include_game_summary,
+        game_filtered_scan=game_filtered_scan,
+    )
+    return handler(tool_input, property_id, opts)
@@ -15,6 +15,7 @@ scope validation logic lives in one place.
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any
 from uuid import uuid4
 
@@ -47,28 +48,56 @@ RECONNECT_DETAIL = (
 SESSIONS: dict[str, dict[str, Any]] = {}
 STATE_INDEX: dict[str, str] = {}
 
+# Built once: every authenticated request checks stored scopes against it.
+_REQUIRED_SCOPES = frozenset(OAUTH_SCOPES)
+
+# Process-local only: ``Credentials`` objects are not JSON-serializable, so
+# they must never be stored in SESSIONS (which is persisted). Keyed by
+# session id; each entry pairs the object with the session's credentials
+# dict it was built from.
+_LIVE_CREDENTIALS: dict[str, tuple[dict[str, Any], Credentials]] = {}
+
 
 # ---------------------------------------------------------------------------
 # OAuth flow
 # ---------------------------------------------------------------------------
 
-def get_oauth_flow() -> Flow:
-    """Build a Google OAuth ``Flow`` configured from env."""
-    try:
-        cfg = get_oauth_client_config()
-    except ValueError as exc:
-        raise HTTPException(status_code=500, detail=str(exc))
-    client_config = {
+@lru_cache(maxsize=4)
+def _oauth_client_config(
+    client_id: str,
+    client_secret: str,
+    redirect_uri: str,
+) -> dict[str, Any]:
+    """Google ``client secrets`` dict, built once per distinct env triple.
+
+    Keyed on the raw values so an env change at runtime still yields a fresh
+    config. ``Flow`` only reads this dict, so sharing it is safe.
+    """
+    return {
         "web": {
-            "client_id": cfg["client_id"],
-            "client_secret": cfg["client_secret"],
-            "redirect_uris": [cfg["redirect_uri"]],
+            "client_id": client_id,
+            "client_secret": client_secret,
+            "redirect_uris": [redirect_uri],
             "auth_uri": "https://accounts.google.com/o/oauth2/auth",
             "token_uri": "https://oauth2.googleapis.com/token",
         }
     }
+
+
+def get_oauth_flow() -> Flow:
+    """Build a Google OAuth ``Flow`` configured from env.
+
+    The ``Flow`` itself is built per call: it carries per-login state (OAuth
+    session, PKCE verifier, fetched token) and must not be shared.
+    """
+    try:
+        cfg = get_oauth_client_config()
+    except ValueError as exc:
+        raise HTTPException(status_code=500, detail=str(exc))
     return Flow.from_client_config(
-        client_config=client_config,
+        client_config=_oauth_client_config(
+            cfg["client_id"], cfg["client_secret"], cfg["redirect_uri"]
+        ),
         scopes=list(OAUTH_SCOPES),
         redirect_uri=cfg["redirect_uri"],
     )
@@ -84,8 +113,9 @@ def get_session_id(request: Request) -> str | None:
 
 def get_session_dict(session_id: str) -> dict[str, Any] | None:
     """Return the session payload, hydrating from SQLite on first lookup."""
-    if session_id in SESSIONS:
-        return SESSIONS[session_id]
+    session = SESSIONS.get(session_id)
+    if session is not None:
+        return session
     stored = sessions.load_session(session_id)
     if stored is not None:
         SESSIONS[session_id] = stored
@@ -140,6 +170,13 @@ def credentials_to_dict(credentials: Credentials) -> dict[str, Any]:
     }
 
 
+def _drop_credentials(session: dict[str, Any], session_id: str | None) -> None:
+    session.pop("credentials", None)
+    if session_id:
+        _LIVE_CREDENTIALS.pop(session_id, None)
+        persist_session(session_id)
+
+
 def build_user_credentials(
     session: dict[str, Any], session_id: str | None = None
 ) -> Credentials | None:
@@ -148,39 +185,42 @@ def build_user_credentials(
     Returns ``None`` if any required scope is missing, the credentials are
     malformed, or refresh fails -- the route layer maps that to a 401 +
     :data:`RECONNECT_DETAIL`.
+
+    The live object is reused across requests for as long as
+    ``session["credentials"]`` is the same dict it was built from; replacing
+    that dict (OAuth callback, refresh) or dropping it invalidates the cache.
     """
     data = session.get("credentials")
     if not data:
         return None
-    stored_scopes = set(data.get("scopes") or [])
-    if not set(OAUTH_SCOPES).issubset(stored_scopes):
-        session.pop("credentials", None)
-        if session_id:
-            persist_session(session_id)
-        return None
-    try:
-        credentials = Credentials(**data)
-    except (TypeError, ValueError):
-        session.pop("credentials", None)
-        if session_id:
-            persist_session(session_id)
-        return None
+    cached = _LIVE_CREDENTIALS.get(session_id) if session_id else None
+    if cached is not None and cached[0] is data:
+        credentials = cached[1]
+        if credentials.valid:
+            return credentials
+    else:
+        if not _REQUIRED_SCOPES.issubset(data.get("scopes") or ()):
+            _drop_credentials(session, session_id)
+            return None
+        try:
+            credentials = Credentials(**data)
+        except (TypeError, ValueError):
+            _drop_credentials(session, session_id)
+            return None
     if not credentials.valid:
         if not credentials.refresh_token:
-            session.pop("credentials", None)
-            if session_id:
-                persist_session(session_id)
+            _drop_credentials(session, session_id)
             return None
         try:
             credentials.refresh(GoogleAuthRequest())
         except RefreshError:
-            session.pop("credentials", None)
-            if session_id:
-                persist_session(session_id)
+            _drop_credentials(session, session_id)
             return None
         session["credentials"] = credentials_to_dict(credentials)
         if session_id:
             persist_session(session_id)
+    if session_id:
+        _LIVE_CREDENTIALS[session_id] = (session["credentials"], credentials)
     return credentials
 
 
@@ -59,10 +59,13 @@ stays in one place.
 from __future__ import annotations
 
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from google.api_core import exceptions as gexc
 
+from backend.bigquery import status as bq_status
+from backend.bigquery.status import _MAX_METADATA_WORKERS
 from backend.bigquery.client import (
     _import_bigquery,
     get_bq_client,
@@ -927,6 +930,29 @@ LEFT JOIN top_stall ts USING (level_id)
 """
 
 
+def _delete_one_table(client: Any, full_table_id: str) -> None:
+    try:
+        client.delete_table(full_table_id, not_found_ok=True)
+    except Exception:  # noqa: BLE001
+        pass
+
+
+def _delete_tables_best_effort(
+    client: Any, dataset_ref: str, table_names: list[str]
+) -> None:
+    """Drop the filtered-scan temp tables concurrently; failures are swallowed.
+
+    The tables are independent, so the deletes are issued in parallel and the
+    cleanup costs about one round-trip instead of one per table.
+    """
+    if not table_names:
+        return
+    workers = min(len(table_names), _MAX_METADATA_WORKERS)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for t in table_names:
+            pool.submit(_delete_one_table, client, f"{dataset_ref}.{t}")
+
+
 def _new_filtered_scan_suffix() -> str:
     """Return a short unique fragment for temp game_* table names (BQ-safe)."""
     return f"f_{uuid.uuid4().hex[:10]}"
@@ -1034,11 +1060,8 @@ def materialize_game_filtered_for_deep_scan(
     created: list[str] = []
 
     def _run_drop_created() -> None:
-        for t in reversed(created):
-            try:
-                client.delete_table(f"{dataset_ref}.{t}", not_found_ok=True)
-            except Exception:  # noqa: BLE001
-                pass
+        _delete_tables_best_effort(client, dataset_ref, created)
+        bq_status.invalidate_dataset_status(dataset_ref)
 
     try:
         sess_cfg = bq.QueryJobConfig(
@@ -1161,11 +1184,8 @@ def drop_game_filtered_scan_tables(property_id: str, table_names: list[str]) ->
         client = get_bq_client()
     except ValueError:
         return
-    for t in table_names:
-        try:
-            client.delete_table(f"{dataset_ref}.{t}", not_found_ok=True)
-        except Exception:  # noqa: BLE001
-            pass
+    _delete_tables_best_effort(client, dataset_ref, table_names)
+    bq_status.invalidate_dataset_status(dataset_ref)
 
 
 def _build_game_events_test_sql(dataset_ref: str) -> str:
@@ -396,11 +396,12 @@ def _run_ctas(
     t0 = time.monotonic()
     job = client.query(sql, job_config=job_config)
     job.result()  # block until the table is written
+    bq_status.invalidate_dataset_status(dataset_ref)
     elapsed_ms = int((time.monotonic() - t0) * 1000)
     try:
         table = client.get_table(f"{dataset_ref}.{table_name}")
         row_count = int(table.num_rows) if table.num_rows is not None else None
-    except Exception:  # noqa: BLE001 - row count is nice-to-have, not critical
+    except gexc.GoogleAPIError:  # row count is nice-to-have, not critical
         row_count = None
     return {
         "table": table_name,
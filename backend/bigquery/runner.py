@@ -19,7 +19,7 @@ from __future__ import annotations
 import logging
 import os
 import re
-from typing import Any
+from typing import Any, Callable
 
 from google.api_core import exceptions as gexc
 
@@ -37,6 +37,10 @@ HARD_ROW_LIMIT = 50
 # blowing up JSON size / agent context.
 MAX_CELL_CHARS = 120
 
+# Scalar BigQuery column types whose Python values are already JSON-safe, so
+# their cells are returned as-is without per-value type checks.
+_PASSTHROUGH_TYPES = frozenset({"INTEGER", "INT64", "FLOAT", "FLOAT64", "BOOLEAN", "BOOL"})
+
 # Default per-job byte cap when no env override is set.
 DEFAULT_MAX_BYTES_BILLED = 100_000_000  # 100 MB
 
@@ -62,6 +66,10 @@ FORBIDDEN_KEYWORDS = (
     "load", "export",
 )
 
+# One alternation instead of a regex search per keyword; compiled once at
+# import so validation is a single scan of the cleaned SQL.
+_FORBIDDEN_RE = re.compile(r"\b(" + "|".join(FORBIDDEN_KEYWORDS) + r")\b")
+
 
 # ---------------------------------------------------------------------------
 # Validation
@@ -99,9 +107,10 @@ def _validate_bq_query(sql: str, dataset_ref: str) -> str | None:
     cleaned = _strip_sql_noise(stripped)
     lowered = cleaned.lower()
 
-    for kw in FORBIDDEN_KEYWORDS:
-        if re.search(rf"\b{kw}\b", lowered):
-            return f"Forbidden keyword: {kw.upper()}. Only read-only SELECT queries are allowed."
+    forbidden = _FORBIDDEN_RE.search(lowered)
+    if forbidden:
+        kw = forbidden.group(1)
+        return f"Forbidden keyword: {kw.upper()}. Only read-only SELECT queries are allowed."
 
     body = cleaned.rstrip().rstrip(";")
     if ";" in body:
@@ -128,7 +137,7 @@ def _validate_bq_query(sql: str, dataset_ref: str) -> str | None:
                 f"Query must only reference dataset '{dataset_ref}'. "
                 f"Found: '{proj_ds}' (from ref {ref!r})."
             )
-        if not any(table.startswith(prefix) for prefix in ALLOWED_TABLE_PREFIXES):
+        if not table.startswith(ALLOWED_TABLE_PREFIXES):
             allowed = ", ".join(ALLOWED_TABLE_PREFIXES)
             return (
                 f"Table '{table}' must start with one of: {allowed}. "
@@ -156,6 +165,33 @@ def _coerce_cell(value: Any) -> Any:
     return rendered if len(rendered) <= MAX_CELL_CHARS else rendered[:MAX_CELL_CHARS]
 
 
+def _truncate_str(value: str | None) -> str | None:
+    if value is None:
+        return None
+    return value if len(value) <= MAX_CELL_CHARS else value[:MAX_CELL_CHARS]
+
+
+def _passthrough(value: Any) -> Any:
+    return value
+
+
+def _cell_coercer(field: Any) -> Callable[[Any], Any]:
+    """Pick a per-column converter from the result schema.
+
+    The schema already tells us which columns are plain strings / numbers, so
+    those skip the ``isinstance`` ladder in :func:`_coerce_cell`. Repeated,
+    record, and temporal columns still go through the generic path.
+    """
+    if getattr(field, "mode", None) == "REPEATED":
+        return _coerce_cell
+    field_type = (getattr(field, "field_type", None) or "").upper()
+    if field_type == "STRING":
+        return _truncate_str
+    if field_type in _PASSTHROUGH_TYPES:
+        return _passthrough
+    return _coerce_cell
+
+
 def resolve_max_bytes(max_bytes: int | None = None) -> int:
     """Pick the effective ``maximum_bytes_billed`` for a query.
 
@@ -221,9 +257,12 @@ def run_bq_query(
         use_query_cache=True,
     )
 
+    # ``max_results`` caps the fetch at the first page we actually return;
+    # ``total_rows`` is still reported by BigQuery, so truncation detection
+    # works without paging through the rest of the result set.
     try:
         job = client.query(sql, job_config=job_config)
-        rows_iter = job.result()
+        rows_iter = job.result(max_results=HARD_ROW_LIMIT)
     except gexc.Forbidden as exc:
         return {"error": f"BigQuery access denied: {getattr(exc, 'message', str(exc))}"}
     except gexc.NotFound as exc:
@@ -233,26 +272,33 @@ def run_bq_query(
     except Exception as exc:  # noqa: BLE001 - surface any BQ failure to the caller
         return {"error": f"BigQuery error: {exc}"}
 
+    # Resolve (position, name, converter) once from the schema; each row is
+    # then read positionally instead of being copied into an intermediate dict.
+    schema = getattr(rows_iter, "schema", None) or []
+    plan = [
+        (index, field.name, _cell_coercer(field))
+        for index, field in enumerate(schema)
+    ]
+
     rows: list[dict[str, Any]] = []
     for row in rows_iter:
         if len(rows) >= HARD_ROW_LIMIT:
             break
-        rows.append({key: _coerce_cell(value) for key, value in dict(row).items()})
+        rows.append({name: coerce(row[index]) for index, name, coerce in plan})
 
     total_rows = getattr(rows_iter, "total_rows", None)
     truncated = total_rows is not None and total_rows > len(rows)
     if rows:
         columns = list(rows[0].keys())
     else:
-        schema = getattr(rows_iter, "schema", None) or []
         columns = [field.name for field in schema]
 
-    warning = None
-    if truncated:
-        warning = (
-            f"Result truncated to {HARD_ROW_LIMIT} rows of {total_rows}. "
-            "Add filters or a LIMIT clause to narrow the query."
-        )
+    warning = (
+        f"Result truncated to {HARD_ROW_LIMIT} rows of {total_rows}. "
+        "Add filters or a LIMIT clause to narrow the query."
+        if truncated
+        else None
+    )
 
     return {
         "row_count": len(rows),
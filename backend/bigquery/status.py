@@ -8,6 +8,8 @@ glue in :mod:`backend.bigquery.client`.
 from __future__ import annotations
 
 import logging
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Any
 
 from google.api_core import exceptions as gexc
@@ -20,6 +22,27 @@ from backend.bigquery.client import (
 from backend.bigquery.runner import resolve_max_bytes
 
 
+# Upper bound on concurrent table-metadata calls per request: ``get_table``
+# here and the temp-table deletes in :mod:`materialize_game`. The table sets
+# are small (2-5 tables), so this mostly guards future growth rather than
+# throttling today's callers.
+_MAX_METADATA_WORKERS = 8
+
+# ``list_tables`` pages through every ``events_*`` shard. Callers are the
+# agent's ``describe`` action (once per agent run, possibly repeated within a
+# run) and the web materializer's window resolution; ``/api/bigquery/status``
+# also reads it but the frontend does not poll that route. A short TTL lets
+# repeated ``describe`` calls skip the listing; writers call
+# :func:`invalidate_dataset_status` after creating or dropping tables. Only
+# ``exists=True`` payloads are cached so a freshly linked dataset shows up on
+# the next call.
+DATASET_STATUS_TTL_SECONDS = 60.0
+_DATASET_STATUS_CACHE: dict[str, tuple[float, dict[str, Any]]] = {}
+# Bumped by every invalidation. A fetch that started under an older
+# generation may hold a pre-write table list, so it must not be cached.
+_DATASET_STATUS_GENERATION: dict[str, int] = {}
+
+
 def _collect_tables(client: Any, dataset: Any) -> list[dict[str, Any]]:
     """Lightweight metadata for every table in the dataset.
 
@@ -58,6 +81,48 @@ def _collect_date_range(
     return (suffixes[0], suffixes[-1])
 
 
+def _get_table_or_none(client: Any, full_table_id: str) -> Any:
+    try:
+        return client.get_table(full_table_id)
+    except gexc.NotFound:
+        return None
+
+
+def _get_tables_concurrently(
+    client: Any,
+    full_table_ids: list[str],
+) -> list[Future]:
+    """Issue ``get_table`` for every id at once; futures come back in input order.
+
+    Each future resolves to the table, or ``None`` if it does not exist. Other
+    errors (e.g. ``Forbidden``) are re-raised from ``future.result()`` so the
+    caller can attach the table name to the message. The lookups are pure
+    network round-trips, so wall time drops from the sum of latencies to
+    roughly the slowest one.
+    """
+    if not full_table_ids:
+        return []
+    workers = min(len(full_table_ids), _MAX_METADATA_WORKERS)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return [
+            pool.submit(_get_table_or_none, client, full)
+            for full in full_table_ids
+        ]
+
+
+def _table_freshness(table: Any) -> dict[str, Any]:
+    """``exists`` / ``last_modified`` / ``row_count`` for a fetched table."""
+    return {
+        "exists": True,
+        "last_modified": (
+            table.modified.isoformat()
+            if getattr(table, "modified", None) is not None
+            else None
+        ),
+        "row_count": int(table.num_rows) if table.num_rows is not None else None,
+    }
+
+
 def get_dataset_status(property_id: str) -> dict[str, Any]:
     """Report whether the GA4 export dataset for this property exists.
 
@@ -74,8 +139,16 @@ def get_dataset_status(property_id: str) -> dict[str, Any]:
             "earliest_date": "YYYYMMDD" | None,
             "latest_date": "YYYYMMDD" | None,
         }
+
+    Successful lookups are cached per dataset for
+    :data:`DATASET_STATUS_TTL_SECONDS`; callers get a shallow copy.
     """
     dataset_ref = resolve_dataset_ref(property_id)
+    cached = _DATASET_STATUS_CACHE.get(dataset_ref)
+    if cached is not None and cached[0] > time.monotonic():
+        return dict(cached[1])
+    generation = _DATASET_STATUS_GENERATION.get(dataset_ref, 0)
+
     client = get_bq_client()
 
     try:
@@ -100,7 +173,7 @@ def get_dataset_status(property_id: str) -> dict[str, Any]:
     tables = _collect_tables(client, dataset)
     earliest, latest = _collect_date_range(tables)
 
-    return {
+    payload = {
         "dataset_ref": dataset_ref,
         "exists": True,
         "location": dataset.location,
@@ -108,6 +181,24 @@ def get_dataset_status(property_id: str) -> dict[str, Any]:
         "earliest_date": earliest,
         "latest_date": latest,
     }
+    if _DATASET_STATUS_GENERATION.get(dataset_ref, 0) == generation:
+        _DATASET_STATUS_CACHE[dataset_ref] = (
+            time.monotonic() + DATASET_STATUS_TTL_SECONDS,
+            payload,
+        )
+    return dict(payload)
+
+
+def invalidate_dataset_status(dataset_ref: str) -> None:
+    """Drop the cached :func:`get_dataset_status` payload for a dataset.
+
+    Also bumps the dataset's generation so an in-flight lookup that started
+    before this call does not re-cache its stale table list.
+    """
+    _DATASET_STATUS_GENERATION[dataset_ref] = (
+        _DATASET_STATUS_GENERATION.get(dataset_ref, 0) + 1
+    )
+    _DATASET_STATUS_CACHE.pop(dataset_ref, None)
 
 
 def list_tables(property_id: str) -> list[dict[str, Any]]:
@@ -126,28 +217,25 @@ def _list_named_tables(property_id: str, expected: tuple[str, ...]) -> dict[str,
     dataset_ref = resolve_dataset_ref(property_id)
     client = get_bq_client()
 
+    futures = _get_tables_concurrently(
+        client, [f"{dataset_ref}.{name}" for name in expected]
+    )
+
     tables_info: list[dict[str, Any]] = []
-    for name in expected:
-        full = f"{dataset_ref}.{name}"
+    for name, future in zip(expected, futures):
         try:
-            table = client.get_table(full)
-        except gexc.NotFound:
-            tables_info.append({"name": name, "exists": False})
-            continue
+            table = future.result()
         except gexc.Forbidden as exc:
             raise ValueError(
                 f"Access denied listing summary table {name}: {exc}"
             ) from exc
+        if table is None:
+            tables_info.append({"name": name, "exists": False})
+            continue
         tables_info.append(
             {
                 "name": name,
-                "exists": True,
-                "last_modified": (
-                    table.modified.isoformat()
-                    if getattr(table, "modified", None) is not None
-                    else None
-                ),
-                "row_count": int(table.num_rows) if table.num_rows is not None else None,
+                **_table_freshness(table),
             }
         )
 
@@ -161,7 +249,9 @@ def list_web_summary_tables(property_id: str) -> dict[str, Any]:
     successful ``materialize_web`` run. Missing tables stay in the list with
     ``exists=False`` so the UI can prompt for materialization.
     """
-    return _list_named_tables(property_id, ("site_sessions", "site_user_journeys"))
+    from backend.bigquery.materialize_web import SUMMARY_TABLES
+
+    return _list_named_tables(property_id, SUMMARY_TABLES)
 
 
 def list_game_summary_tables(property_id: str) -> dict[str, Any]:
@@ -185,13 +275,21 @@ def list_game_summary_tables_filtered(
     dataset_ref = resolve_dataset_ref(property_id)
     client = get_bq_client()
 
+    items = list(physical_by_logical.items())
+    futures = _get_tables_concurrently(
+        client, [f"{dataset_ref}.{physical}" for _logical, physical in items]
+    )
+
     tables_info: list[dict[str, Any]] = []
-    for logical, physical in physical_by_logical.items():
-        full = f"{dataset_ref}.{physical}"
+    for (logical, physical), future in zip(items, futures):
         bq_fqn = f"`{dataset_ref}.{physical}`"
         try:
-            table = client.get_table(full)
-        except gexc.NotFound:
+            table = future.result()
+        except gexc.Forbidden as exc:
+            raise ValueError(
+                f"Access denied listing game table {logical} ({physical}): {exc}"
+            ) from exc
+        if table is None:
             tables_info.append(
                 {
                     "name": logical,
@@ -201,22 +299,12 @@ def list_game_summary_tables_filtered(
                 }
             )
             continue
-        except gexc.Forbidden as exc:
-            raise ValueError(
-                f"Access denied listing game table {logical} ({physical}): {exc}"
-            ) from exc
         tables_info.append(
             {
                 "name": logical,
                 "physical_name": physical,
                 "ref": bq_fqn,
-                "exists": True,
-                "last_modified": (
-                    table.modified.isoformat()
-                    if getattr(table, "modified", None) is not None
-                    else None
-                ),
-                "row_count": int(table.num_rows) if table.num_rows is not None else None,
+                **_table_freshness(table),
             }
         )
     from backend.bigquery.materialize_game import GAME_EVENTS_TEST_TABLE
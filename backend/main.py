@@ -98,9 +98,10 @@ def auth_login(request: Request):
 @app.get("/api/auth/callback")
 def auth_callback(request: Request):
     state = request.query_params.get("state")
-    session_id = auth.get_session_id(request) or (
-        auth.STATE_INDEX.get(state) if state else None
-    )
+    # Pop unconditionally: the state is single-use, and leaving it behind
+    # would grow STATE_INDEX for the life of the process.
+    indexed_session_id = auth.STATE_INDEX.pop(state, None) if state else None
+    session_id = auth.get_session_id(request) or indexed_session_id
     if not session_id:
         raise HTTPException(status_code=400, detail="Invalid session.")
     session = auth.get_session_dict(session_id)
@@ -463,6 +464,25 @@ def bigquery_materialize_game_filter_options(request: Request) -> dict[str, Any]
 # AI agents (Web Analyst + Game Analyst)
 # ---------------------------------------------------------------------------
 
+# Prompts are module constants, so the catalog is built once at import.
+_AGENT_PROMPT_CATALOG: dict[str, Any] = {
+    "agents": [
+        {
+            "id": "web",
+            "label": agent_prompts.WEB_AGENT_LABEL,
+            "system_prompt": agent_prompts.WEB_SYSTEM_PROMPT,
+            "orchestrator_prompt": agent_prompts.WEB_ORCHESTRATOR_PROMPT,
+        },
+        {
+            "id": "game",
+            "label": agent_prompts.GAME_AGENT_LABEL,
+            "system_prompt": agent_prompts.GAME_SYSTEM_PROMPT,
+            "orchestrator_prompt": agent_prompts.GAME_ORCHESTRATOR_PROMPT,
+        },
+    ]
+}
+
+
 @app.get("/api/agents/prompts")
 def agent_prompt_catalog() -> dict[str, Any]:
     """Read-only prompt catalog for the UI's prompt viewer.
@@ -470,22 +490,7 @@ def agent_prompt_catalog() -> dict[str, Any]:
     Two agents, each with one system prompt and one orchestrator template
     (the user message used by the "Deep Scan" button).
     """
-    return {
-        "agents": [
-            {
-                "id": "web",
-                "label": agent_prompts.WEB_AGENT_LABEL,
-                "system_prompt": agent_prompts.WEB_SYSTEM_PROMPT,
-                "orchestrator_prompt": agent_prompts.WEB_ORCHESTRATOR_PROMPT,
-            },
-            {
-                "id": "game",
-                "label": agent_prompts.GAME_AGENT_LABEL,
-                "system_prompt": agent_prompts.GAME_SYSTEM_PROMPT,
-                "orchestrator_prompt": agent_prompts.GAME_ORCHESTRATOR_PROMPT,
-            },
-        ]
-    }
+    return _AGENT_PROMPT_CATALOG
 
 
 class WebAgentRequest(BaseModel):
@@ -578,19 +583,69 @@ def run_game_agent_endpoint(
 # ---------------------------------------------------------------------------
 
 _FRONTEND_DIST = get_frontend_dist_dir()
+_STATIC_BASE = os.path.abspath(_FRONTEND_DIST) if _FRONTEND_DIST else None
+
+
+def _index_static_files(base: str | None) -> dict[str, str]:
+    """Map each file in the built frontend (relative POSIX path) to its absolute path."""
+    if not base:
+        return {}
+    index: dict[str, str] = {}
+    for root, _dirs, files in os.walk(base):
+        for name in files:
+            full = os.path.join(root, name)
+            index[os.path.relpath(full, base).replace(os.sep, "/")] = full
+    return index
+
+
+def _dist_mtime() -> float | None:
+    if not _STATIC_BASE:
+        return None
+    try:
+        return os.stat(_STATIC_BASE).st_mtime
+    except OSError:
+        return None
+
+
+# Walked once at import and topped up on misses, so hits never touch the
+# filesystem. ``_static_index_mtime`` is the dist directory's mtime when the
+# walk ran; a change means the bundle was rebuilt in place (non-Docker
+# ``FRONTEND_DIST`` setups) and indexed files may be gone.
+_STATIC_FILES = _index_static_files(_STATIC_BASE)
+_static_index_mtime = _dist_mtime()
 
 
 def _resolve_static_path(path: str) -> str | None:
-    if not _FRONTEND_DIST:
+    """Absolute path of a file inside the frontend bundle, or ``None``.
+
+    Hits come straight from :data:`_STATIC_FILES`. On a miss the index is
+    re-walked if the dist directory changed, then the path gets the on-disk
+    containment + ``isfile`` check and is indexed if it exists -- so assets
+    emitted by a rebuild are served instead of falling through to
+    ``index.html``.
+    """
+    global _static_index_mtime
+    if not _STATIC_BASE:
+        return None
+    normalized = os.path.normpath(path.lstrip("/")).replace(os.sep, "/")
+    indexed = _STATIC_FILES.get(normalized)
+    if indexed is not None:
+        return indexed
+
+    mtime = _dist_mtime()
+    if mtime != _static_index_mtime:
+        _static_index_mtime = mtime
+        fresh = _index_static_files(_STATIC_BASE)
+        _STATIC_FILES.clear()
+        _STATIC_FILES.update(fresh)
+
+    candidate = os.path.abspath(os.path.join(_STATIC_BASE, normalized))
+    if os.path.commonpath([candidate, _STATIC_BASE]) != _STATIC_BASE:
         return None
-    normalized = os.path.normpath(path.lstrip("/"))
-    candidate = os.path.abspath(os.path.join(_FRONTEND_DIST, normalized))
-    base = os.path.abspath(_FRONTEND_DIST)
-    if os.path.commonpath([candidate, base]) != base:
+    if not os.path.isfile(candidate):
         return None
-    if os.path.isfile(candidate):
-        return candidate
-    return None
+    _STATIC_FILES[normalized] = candidate
+    return candidate
 
 
 @app.get("/")